@@ -39,12 +39,14 @@ def safe_rag_query(
     # Step 1: Retrieve relevant documents
     docs = vector_db.similarity_search(query, k=k)
     context = [doc.page_content for doc in docs]
+    context_joined = "\n".join(context)
+    context_bulleted = "\n".join(f"- {c}" for c in context)
     
     # Step 2: Generate response
     prompt = f"""Based on the following context, answer the question.
 
 Context:
-{chr(10).join(context)}
+{context_joined}
 
 Question: {query}
 
@@ -76,7 +78,7 @@ Answer:"""
             strict_prompt = f"""Answer ONLY using the facts below. Do not add any information.
 
 Facts:
-{chr(10).join(f"- {c}" for c in context)}
+{context_bulleted}
 
 Question: {query}
 
@@ -15,7 +15,9 @@ Basic usage:
 For more information, see: https://docs.tensalis.com
 """
 
+from .async_client import AsyncTensalisClient
 from .client import TensalisClient, VerificationResult
+from .semantic_cache import SemanticCache
 from .exceptions import (
     TensalisError,
     TensalisAPIError,
@@ -33,7 +35,9 @@ __email__ = "engineering@tensalis.com"
 __all__ = [
     # Client
     "TensalisClient",
+    "AsyncTensalisClient",
     "VerificationResult",
+    "SemanticCache",
     # Exceptions
     "TensalisError",
     "TensalisAPIError",
@@ -0,0 +1,290 @@
+# tensalis/async_client.py
+"""
+Asynchronous client for the Tensalis Hallucination Detection API.
+
+Mirrors the synchronous ``TensalisClient`` API on top of ``httpx.AsyncClient``,
+so verification round-trips can overlap with token streaming and many
+``/verify`` calls can be multiplexed over a single HTTP/2 connection.
+
+Requires the optional ``async`` extra: ``pip install "tensalis[async]"``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None  # type: ignore[assignment]
+
+from .client import (
+    TensalisClient,
+    VerificationResult,
+    _RETRY_STATUSES,
+    _api_error,
+    _count_tokens,
+    _decode_json,
+    _dumps,
+    _normalize_context,
+    _retry_after,
+    _validate_response,
+)
+from .exceptions import TensalisError, TensalisTimeoutError
+
+
+class AsyncTensalisClient:
+    """
+    Async client for the Tensalis Hallucination Detection API.
+    
+    Args:
+        api_key: Your Tensalis API key.
+        endpoint: API endpoint URL. Defaults to production.
+        timeout: Request timeout in seconds. Defaults to 30.
+        retries: Number of retry attempts for failed requests. Defaults to 3.
+        mode: Verification mode - "strict", "balanced", or "permissive".
+        max_connections: Maximum number of concurrent connections. Defaults to 64.
+        max_response_length: Reject longer responses client-side. None (the
+            default) leaves length limits to the API.
+    
+    Example:
+        >>> async with AsyncTensalisClient(api_key="your-api-key") as client:
+        ...     result = await client.verify(
+        ...         response="The policy allows 90-day returns.",
+        ...         context=["Returns accepted within 30 days."]
+        ...     )
+        ...     if result.is_blocked:
+        ...         print(f"Blocked: {result.reason}")
+    """
+    
+    DEFAULT_ENDPOINT = TensalisClient.DEFAULT_ENDPOINT
+    VERSION = TensalisClient.VERSION
+    
+    def __init__(
+        self,
+        api_key: str,
+        endpoint: str = DEFAULT_ENDPOINT,
+        timeout: int = 30,
+        retries: int = 3,
+        mode: Literal["strict", "balanced", "permissive"] = "balanced",
+        max_connections: int = 64,
+        max_response_length: Optional[int] = None
+    ) -> None:
+        if not api_key:
+            raise TensalisError("API key is required")
+        if httpx is None:
+            raise TensalisError(
+                "AsyncTensalisClient requires httpx: pip install \"tensalis[async]\""
+            )
+        
+        self.api_key = api_key
+        self.endpoint = endpoint.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.mode = mode
+        self.max_response_length = max_response_length
+        
+        self._client = httpx.AsyncClient(
+            base_url=self.endpoint,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections // 2
+            ),
+            timeout=timeout,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+                "User-Agent": f"tensalis-python/{self.VERSION}",
+                "X-Tensalis-Mode": mode
+            }
+        )
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make an API request with retries."""
+        body = _dumps(payload) if payload is not None else None
+        last_error: Optional[Exception] = None
+        
+        # The first attempt plus up to `retries` retries
+        for attempt in range(self.retries + 1):
+            try:
+                response = await self._client.request(method, path, content=body)
+                
+                if response.status_code < 400:
+                    return _decode_json(response.content)
+                
+                error = _api_error(response.status_code, response.content, response.headers)
+                if response.status_code not in _RETRY_STATUSES or attempt == self.retries:
+                    raise error
+                last_error = error
+                
+                if "Retry-After" in response.headers:
+                    # Rate limited - wait as long as the server asks
+                    await asyncio.sleep(_retry_after(response.headers))
+                    continue
+            
+            except httpx.TimeoutException:
+                last_error = TensalisTimeoutError(f"Request timed out after {self.timeout}s")
+            except httpx.HTTPError as e:
+                last_error = TensalisError(f"Request failed: {e}")
+            
+            # Exponential backoff
+            if attempt < self.retries:
+                await asyncio.sleep(2 ** attempt)
+        
+        raise last_error or TensalisError("Request failed after retries")
+    
+    async def verify(
+        self,
+        response: str,
+        context: Union[str, List[str]],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> VerificationResult:
+        """
+        Verify an LLM response against source context.
+        
+        Every call is sent to the API: unlike ``TensalisClient.verify``, there
+        is no result cache and no local fast path for verbatim extracts.
+        
+        Args:
+            response: The LLM-generated response to verify.
+            context: Source context (string or list of strings).
+            metadata: Optional metadata for logging/tracking.
+        
+        Returns:
+            VerificationResult with status, severity, and details.
+        """
+        _validate_response(response, self.max_response_length)
+        context = _normalize_context(context)
+        
+        payload = {
+            "response": response,
+            "reference_facts": context
+        }
+        
+        if metadata:
+            payload["metadata"] = metadata
+        
+        data = await self._request("POST", "/verify", payload)
+        return VerificationResult(data)
+    
+    async def verify_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[VerificationResult]:
+        """
+        Verify multiple responses in a single request.
+        
+        All items go to the API in one request; large batches are not split.
+        
+        Args:
+            items: List of dicts with "response" and "context" keys.
+        
+        Returns:
+            List of VerificationResult, in the order of ``items``.
+        """
+        payload = {"items": items}
+        data = await self._request("POST", "/verify/batch", payload)
+        return [VerificationResult(r) for r in data.get("results", [])]
+    
+    async def verify_stream(
+        self,
+        response_stream: AsyncIterator[str],
+        context: Union[str, List[str]],
+        check_interval: int = 50,
+        max_check_interval: int = 200,
+        interval_growth: float = 2.0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Verify an async streaming response in real-time.
+        
+        Every chunk is yielded as it arrives. Once `check_interval` tokens have
+        accumulated, the text so far is verified and the check is awaited
+        inline, so the stream pauses for each round-trip; there are no
+        background checks and no `emit_batch_size` coalescing. The interval
+        grows by `interval_growth` after every VERIFIED check, up to
+        `max_check_interval`, and falls back to `check_interval` after any
+        other status. Text after the last check is not verified.
+        
+        Args:
+            response_stream: Async iterator yielding response chunks.
+            context: Source context for verification.
+            check_interval: Tokens before the first check (and the minimum interval).
+            max_check_interval: Upper bound on the tokens between checks.
+            interval_growth: Factor applied to the interval after a VERIFIED check.
+        
+        Yields:
+            Dicts with "text", "status" and "result" keys, one per chunk.
+            "status" is "PENDING" except on the chunk that triggered a check.
+            Iteration stops after a "BLOCKED" item.
+        
+        Example:
+            >>> async for chunk in client.verify_stream(llm.astream(prompt), docs):
+            ...     if chunk["status"] == "BLOCKED":
+            ...         break
+            ...     print(chunk["text"], end="")
+        """
+        context = _normalize_context(context)
+        
+        accumulated_parts: List[str] = []
+        token_count = 0
+        current_interval = check_interval
+        max_interval = max(max_check_interval, check_interval)
+        
+        async for chunk in response_stream:
+            accumulated_parts.append(chunk)
+            token_count += _count_tokens(chunk)
+            
+            if token_count >= current_interval:
+                accumulated = "".join(accumulated_parts)
+                result = await self.verify(response=accumulated, context=context)
+                yield {
+                    "text": chunk,
+                    "status": result.status,
+                    "result": result.to_dict(copy=True) if result.is_blocked else None
+                }
+                
+                if result.is_blocked:
+                    return
+                
+                if result.is_verified:
+                    current_interval = min(int(current_interval * interval_growth), max_interval)
+                else:
+                    current_interval = check_interval
+                token_count = 0
+            else:
+                yield {"text": chunk, "status": "PENDING", "result": None}
+    
+    async def health(self) -> Dict[str, Any]:
+        """
+        Check API health status.
+        
+        Returns:
+            Dict with "status" and "latency_ms" keys.
+        """
+        return await self._request("GET", "/health")
+    
+    async def usage(self) -> Dict[str, Any]:
+        """
+        Get current usage statistics for your API key.
+        
+        Returns:
+            Dict with usage metrics and limits.
+        """
+        return await self._request("GET", "/usage")
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> AsyncTensalisClient:
+        return self
+    
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
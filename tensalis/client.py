@@ -8,19 +8,241 @@ detecting hallucinations, contradictions, and fabrications in real-time.
 
 from __future__ import annotations
 
+import datetime
+import email.utils
+import gzip
+import hashlib
+import json
+import math
+import socket
+import threading
 import time
-from typing import Any, Dict, Iterator, List, Literal, Optional, Union
+import warnings
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
-from .exceptions import TensalisAPIError, TensalisError, TensalisTimeoutError
+from .exceptions import (
+    TensalisAPIError,
+    TensalisError,
+    TensalisRateLimitError,
+    TensalisTimeoutError,
+    TensalisValidationError,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ijson = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without the extra
+    zstandard = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .semantic_cache import SemanticCache
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    
+    _loads = json.loads
+
+
+def _decode_json(content: bytes) -> Dict[str, Any]:
+    """Decode a successful response body, raising TensalisError if it is not JSON."""
+    try:
+        data: Dict[str, Any] = _loads(content)
+    except ValueError as e:
+        raise TensalisError(f"Invalid JSON in response: {e}") from e
+    return data
+
+
+def _decode_error(content: bytes) -> Dict[str, Any]:
+    """Decode an error response body; proxies often answer 502/503 with HTML."""
+    if not content:
+        return {}
+    try:
+        data = _loads(content)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+# Statuses retried with backoff before an error is raised
+_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+def _retry_after(headers: Mapping[str, str], default: int = 60) -> int:
+    """Seconds to wait from a Retry-After header, in delta-seconds or HTTP-date form."""
+    value = headers.get("Retry-After")
+    if value is None:
+        return default
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if when.tzinfo is None:
+        # RFC 9110 dates are always GMT; parsedate_to_datetime leaves "-0000" naive
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0, math.ceil(when.timestamp() - time.time()))
+
+
+def _api_error(
+    status_code: int,
+    content: bytes,
+    headers: Mapping[str, str]
+) -> TensalisAPIError:
+    """Build the exception for an HTTP error response."""
+    error_data = _decode_error(content)
+    message = error_data.get("error", "Unknown error")
+    if status_code == 429:
+        return TensalisRateLimitError(
+            message=message,
+            retry_after=_retry_after(headers),
+            response=error_data
+        )
+    return TensalisAPIError(
+        message=message,
+        status_code=status_code,
+        response=error_data
+    )
+
+
+def _compress(body: bytes) -> Tuple[bytes, str]:
+    """Compress a request body with zstd, or gzip when zstandard is unavailable."""
+    if zstandard is not None:
+        # Compressor instances are not thread-safe; verify_batch sends concurrently
+        return zstandard.ZstdCompressor(level=3).compress(body), "zstd"
+    return gzip.compress(body, compresslevel=6), "gzip"
+
+
+def _validate_response(response: str, max_length: Optional[int] = None) -> None:
+    """Reject responses the API would refuse, before paying for a round-trip."""
+    if not isinstance(response, str) or not response:
+        raise TensalisValidationError("must be a non-empty string", field="response")
+    if max_length is not None and len(response) > max_length:
+        raise TensalisValidationError(
+            f"exceeds {max_length} characters",
+            field="response",
+            details={"length": len(response), "max_length": max_length}
+        )
+
+
+def _normalize_context(context: Union[str, List[str]]) -> List[str]:
+    """Return context as a non-empty list of strings."""
+    if isinstance(context, str):
+        context = [context]
+    if not context:
+        raise TensalisValidationError("must contain at least one document", field="context")
+    if not all(isinstance(c, str) for c in context):
+        raise TensalisValidationError("documents must be strings", field="context")
+    return context
+
+
+# Shortest normalised response eligible for the local substring fast path
+_FASTPATH_MIN_CHARS = 16
+
+
+def _normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace for substring comparison."""
+    return " ".join(text.lower().split())
+
+
+# Punctuation that joins alphanumeric runs into one token ("30,000", "3.5", "sub-account")
+_TOKEN_JOINERS = ".,'-"
+
+
+def _continues_token(text: str, i: int, step: int) -> bool:
+    """Return True if ``text[i]`` extends the token next to it (``step`` points away from it)."""
+    if not 0 <= i < len(text):
+        return False
+    if text[i].isalnum():
+        return True
+    j = i + step
+    return text[i] in _TOKEN_JOINERS and 0 <= j < len(text) and text[j].isalnum()
+
+
+def _contains_phrase(text: str, phrase: str) -> bool:
+    """Return True if ``phrase`` occurs in ``text`` without splitting a token at either end."""
+    start = text.find(phrase)
+    while start != -1:
+        end = start + len(phrase)
+        cut_start = phrase[0].isalnum() and _continues_token(text, start - 1, -1)
+        cut_end = phrase[-1].isalnum() and _continues_token(text, end, 1)
+        if not cut_start and not cut_end:
+            return True
+        start = text.find(phrase, start + 1)
+    return False
+
+
+# Space-separated chunks at least this long are token-counted with str.count
+_LARGE_CHUNK_CHARS = 64
+
+
+def _count_tokens(chunk: str) -> int:
+    """Approximate the number of whitespace-delimited tokens in a stream chunk."""
+    if len(chunk) < _LARGE_CHUNK_CHARS or "\n" in chunk or "\t" in chunk:
+        # Markdown and code chunks are separated by newlines/tabs, not just spaces
+        return len(chunk.split())
+    # Scans in C without allocating a list; the off-by-one at chunk edges is
+    # negligible at this size.
+    return chunk.count(" ") + 1
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections have TCP keep-alive enabled."""
+    
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
 
 
 class VerificationResult:
     """Represents the result of a verification request."""
     
+    __slots__ = ("_data", "_view")
+    
     def __init__(self, data: Dict[str, Any]) -> None:
         self._data = data
+        self._view = MappingProxyType(data)
     
     @property
     def status(self) -> Literal["VERIFIED", "BLOCKED", "WARNING"]:
@@ -62,9 +284,24 @@ class VerificationResult:
         """Returns True if the response passed verification."""
         return self.status == "VERIFIED"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Return the raw response data as a dictionary."""
-        return self._data.copy()
+    @overload
+    def to_dict(self, *, copy: Literal[False] = ...) -> Mapping[str, Any]: ...
+    
+    @overload
+    def to_dict(self, *, copy: Literal[True]) -> Dict[str, Any]: ...
+    
+    def to_dict(self, *, copy: bool = False) -> Mapping[str, Any]:
+        """
+        Return the raw response data.
+        
+        By default this is a read-only view of the underlying data; pass
+        ``copy=True`` for a mutable ``dict``.
+        """
+        return dict(self._data) if copy else self._view
+    
+    def __reduce__(self) -> Tuple[Any, Tuple[Dict[str, Any]]]:
+        # mappingproxy cannot be pickled; rebuild the view from the data
+        return (VerificationResult, (self._data,))
     
     def __repr__(self) -> str:
         return f"VerificationResult(status={self.status!r}, severity={self.severity!r})"
@@ -80,6 +317,23 @@ class TensalisClient:
         timeout: Request timeout in seconds. Defaults to 30.
         retries: Number of retry attempts for failed requests. Defaults to 3.
         mode: Verification mode - "strict", "balanced", or "permissive".
+        pool_maxsize: Maximum number of pooled keep-alive connections. Defaults to 32.
+        cache_size: Number of verify() results kept in an in-process LRU cache.
+            Set to 0 to disable caching. Defaults to 1024.
+        semantic_cache: Optional SemanticCache consulted for near-duplicate
+            (response, context) pairs on exact-cache misses.
+        max_batch_size: Items sent per /verify/batch request. Defaults to 64.
+        max_concurrency: Concurrent /verify/batch requests. Defaults to 8.
+        compression_threshold: Request bodies larger than this many bytes are
+            sent zstd- (or gzip-) compressed; only set it if your endpoint
+            accepts a request Content-Encoding. Defaults to None (disabled).
+        enable_local_fastpath: Return VERIFIED without an API call when the
+            response is a verbatim (case/whitespace-insensitive) extract of the
+            context. Defaults to on, except in "strict" mode where omissions
+            can still mislead; enabling it explicitly in strict mode warns.
+        max_response_length: Reject longer responses client-side with
+            TensalisValidationError. None (the default) leaves length limits
+            to the API.
     
     Example:
         >>> client = TensalisClient(api_key="your-api-key")
@@ -100,7 +354,15 @@ class TensalisClient:
         endpoint: str = DEFAULT_ENDPOINT,
         timeout: int = 30,
         retries: int = 3,
-        mode: Literal["strict", "balanced", "permissive"] = "balanced"
+        mode: Literal["strict", "balanced", "permissive"] = "balanced",
+        pool_maxsize: int = 32,
+        cache_size: int = 1024,
+        semantic_cache: Optional[SemanticCache] = None,
+        max_batch_size: int = 64,
+        max_concurrency: int = 8,
+        compression_threshold: Optional[int] = None,
+        enable_local_fastpath: Optional[bool] = None,
+        max_response_length: Optional[int] = None
     ) -> None:
         if not api_key:
             raise TensalisError("API key is required")
@@ -110,60 +372,188 @@ class TensalisClient:
         self.timeout = timeout
         self.retries = retries
         self.mode = mode
+        self.cache_size = cache_size
+        self.semantic_cache = semantic_cache
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.compression_threshold = compression_threshold
+        self.max_response_length = max_response_length
+        
+        if enable_local_fastpath is None:
+            enable_local_fastpath = mode != "strict"
+        elif enable_local_fastpath and mode == "strict":
+            warnings.warn(
+                "enable_local_fastpath skips the API for verbatim extracts of the context; "
+                "in strict mode a selective extract can still mislead by omission",
+                stacklevel=2
+            )
+        self.enable_local_fastpath = enable_local_fastpath
+        
+        self._urls = {
+            path: f"{self.endpoint}{path}"
+            for path in ("/verify", "/verify/batch", "/health", "/usage")
+        }
+        
+        self._cache: OrderedDict[bytes, Dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._local_hits = 0
         
         self._session = requests.Session()
         self._session.headers.update({
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
             "User-Agent": f"tensalis-python/{self.VERSION}",
-            "X-Tensalis-Mode": mode
+            "X-Tensalis-Mode": mode,
+            "Connection": "keep-alive"
         })
+        
+        # Reuse TCP+TLS connections across calls, including between retries.
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = _KeepAliveAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+    
+    def _send(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False
+    ) -> requests.Response:
+        """
+        Send an API request and return the successful HTTP response.
+        
+        `body` sends pre-encoded JSON as-is. Retries (with backoff and
+        Retry-After handling) happen inside the mounted adapter; this only
+        translates the final outcome into SDK exceptions.
+        """
+        url = self._urls.get(path) or f"{self.endpoint}{path}"
+        if body is None and payload is not None:
+            body = _dumps(payload)
+        
+        threshold = self.compression_threshold
+        if body is not None and threshold is not None and len(body) > threshold:
+            body, encoding = _compress(body)
+            headers = {**(headers or {}), "Content-Encoding": encoding}
+        
+        try:
+            response = self._session.request(
+                method=method,
+                url=url,
+                data=body,
+                headers=headers,
+                timeout=self.timeout,
+                stream=stream
+            )
+        except requests.RequestException as e:
+            raise self._transport_error(e) from e
+        
+        if response.status_code >= 400:
+            raise _api_error(response.status_code, response.content, response.headers)
+        
+        return response
+    
+    def _transport_error(self, error: Exception) -> TensalisError:
+        """Translate a requests/urllib3 failure into the matching SDK exception."""
+        # Exhausted retries on timeouts surface as a wrapped MaxRetryError, and
+        # timeouts while reading a body as a wrapped ReadTimeoutError
+        cause = error.args[0] if error.args else None
+        reason = getattr(cause, "reason", None)
+        if isinstance(error, requests.Timeout) or any(
+            isinstance(e, urllib3.exceptions.TimeoutError) for e in (error, cause, reason)
+        ):
+            return TensalisTimeoutError(f"Request timed out after {self.timeout}s")
+        return TensalisError(f"Request failed: {error}")
     
     def _request(
         self,
         method: str,
         path: str,
-        payload: Optional[Dict[str, Any]] = None
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
-        """Make an API request with retries."""
-        url = f"{self.endpoint}{path}"
-        last_error: Optional[Exception] = None
-        
-        for attempt in range(self.retries):
-            try:
-                response = self._session.request(
-                    method=method,
-                    url=url,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                
-                if response.status_code == 429:
-                    # Rate limited - wait and retry
-                    retry_after = int(response.headers.get("Retry-After", 1))
-                    time.sleep(retry_after)
-                    continue
-                
-                if response.status_code >= 400:
-                    error_data = response.json() if response.content else {}
-                    raise TensalisAPIError(
-                        message=error_data.get("error", "Unknown error"),
-                        status_code=response.status_code,
-                        response=error_data
-                    )
-                
-                return response.json()
-                
-            except requests.Timeout as e:
-                last_error = TensalisTimeoutError(f"Request timed out after {self.timeout}s")
-            except requests.RequestException as e:
-                last_error = TensalisError(f"Request failed: {e}")
-            
-            # Exponential backoff
-            if attempt < self.retries - 1:
-                time.sleep(2 ** attempt)
+        """Make an API request and decode the JSON response."""
+        response = self._send(method, path, payload, body=body, headers=headers)
+        return _decode_json(response.content)
+    
+    def _cache_key(self, response: str, context: List[str]) -> bytes:
+        """Hash a (response, context, mode) triple into a compact cache key."""
+        parts = [response.encode(), *[c.encode() for c in context], self.mode.encode()]
+        return hashlib.blake2b(b"\x00".join(parts), digest_size=16).digest()
+    
+    def _cache_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            data = self._cache.get(key)
+            if data is None:
+                self._cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._cache_hits += 1
+            return data
+    
+    def _cache_put(self, key: bytes, data: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            self._cache[key] = data
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def cache_clear(self) -> None:
+        """Clear the verify() result cache and reset its statistics."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+            self._local_hits = 0
+    
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size of the verify() result cache."""
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "local_hits": self._local_hits,
+                "size": len(self._cache),
+                "maxsize": self.cache_size,
+            }
+    
+    def _local_fastpath(self, response: str, context: List[str]) -> Optional[VerificationResult]:
+        """Return a VERIFIED result if `response` is quoted verbatim from `context`."""
+        norm_response = _normalize_text(response)
+        if len(norm_response) < _FASTPATH_MIN_CHARS:
+            return None
+        # Match whole tokens within a single document: text spanning two
+        # documents is not a quote, and "within 3" must not match "within 30".
+        if not any(_contains_phrase(_normalize_text(c), norm_response) for c in context):
+            return None
         
-        raise last_error or TensalisError("Request failed after retries")
+        with self._cache_lock:
+            self._local_hits += 1
+        return VerificationResult({
+            "status": "VERIFIED",
+            "confidence": 1.0,
+            "layer": "client_substring",
+            "latency_ms": 0
+        })
     
     def verify(
         self,
@@ -174,6 +564,11 @@ class TensalisClient:
         """
         Verify an LLM response against source context.
         
+        Results are cached per (response, context, mode), so repeated checks
+        of an identical pair skip the API round-trip, as do responses quoted
+        verbatim from the context (see `enable_local_fastpath`). Calls that
+        carry ``metadata`` always reach the API so the metadata is recorded.
+        
         Args:
             response: The LLM-generated response to verify.
             context: Source context (string or list of strings).
@@ -188,9 +583,33 @@ class TensalisClient:
             ...     context=["The CEO is Jane Doe."]
             ... )
             >>> print(result.status)  # "BLOCKED"
+        
+        Raises:
+            TensalisValidationError: If the response is empty or longer than
+                `max_response_length`, or the context is empty.
         """
-        if isinstance(context, str):
-            context = [context]
+        _validate_response(response, self.max_response_length)
+        context = _normalize_context(context)
+        
+        if self.enable_local_fastpath and not metadata:
+            local = self._local_fastpath(response, context)
+            if local is not None:
+                return local
+        
+        key: Optional[bytes] = None
+        if self.cache_size > 0 and not metadata:
+            key = self._cache_key(response, context)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return VerificationResult(cached)
+        
+        semantic_cache = self.semantic_cache if not metadata else None
+        embedding = None
+        if semantic_cache is not None:
+            embedding = semantic_cache.embed(response + "\n" + "\n".join(context))
+            similar = semantic_cache.get(embedding, self.mode)
+            if similar is not None:
+                return similar
         
         payload = {
             "response": response,
@@ -201,6 +620,22 @@ class TensalisClient:
             payload["metadata"] = metadata
         
         data = self._request("POST", "/verify", payload)
+        result = VerificationResult(data)
+        if key is not None:
+            self._cache_put(key, data)
+        if semantic_cache is not None:
+            semantic_cache.put(embedding, result, self.mode)
+        return result
+    
+    def _verify_raw(
+        self,
+        response: str,
+        context_bytes: bytes,
+        headers: Optional[Dict[str, str]] = None
+    ) -> VerificationResult:
+        """Verify `response` against context already encoded as a JSON array."""
+        body = b'{"response":' + _dumps(response) + b',"reference_facts":' + context_bytes + b"}"
+        data = self._request("POST", "/verify", body=body, headers=headers)
         return VerificationResult(data)
     
     def verify_batch(
@@ -210,6 +645,9 @@ class TensalisClient:
         """
         Verify multiple responses in a single request.
         
+        Large batches are split into sub-batches of `max_batch_size` items
+        that are sent concurrently; results are returned in input order.
+        
         Args:
             items: List of dicts with "response" and "context" keys.
         
@@ -222,29 +660,112 @@ class TensalisClient:
             ...     {"response": "Answer 2", "context": ["Fact 2"]},
             ... ])
         """
-        payload = {"items": items}
-        data = self._request("POST", "/verify/batch", payload)
-        return [VerificationResult(r) for r in data.get("results", [])]
+        size = self.max_batch_size
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        
+        if len(chunks) <= 1:
+            data = self._request("POST", "/verify/batch", {"items": items})
+            return [VerificationResult(r) for r in data.get("results", [])]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(chunks))) as executor:
+            futures = [
+                executor.submit(self._request, "POST", "/verify/batch", {"items": chunk})
+                for chunk in chunks
+            ]
+            return [
+                VerificationResult(r)
+                for future in futures
+                for r in future.result().get("results", [])
+            ]
+    
+    def iter_verify_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Iterator[VerificationResult]:
+        """
+        Verify multiple responses in one request, yielding results as they arrive.
+        
+        The response body is decoded incrementally when ijson is installed
+        (``pip install "tensalis[streaming]"``), so large batches are never held
+        in memory at once. Breaking out of the loop closes the connection.
+        The request is sent when iteration starts.
+        
+        Args:
+            items: List of dicts with "response" and "context" keys.
+        
+        Yields:
+            VerificationResult objects in input order.
+        
+        Example:
+            >>> for result in client.iter_verify_batch(items):
+            ...     if result.is_blocked:
+            ...         break
+        """
+        response = self._send("POST", "/verify/batch", {"items": items}, stream=True)
+        try:
+            yield from self._iter_batch_results(response)
+        except (urllib3.exceptions.HTTPError, requests.RequestException) as e:
+            # The body is read lazily, after _send has returned
+            raise self._transport_error(e) from e
+        finally:
+            response.close()
+    
+    @staticmethod
+    def _iter_batch_results(response: requests.Response) -> Iterator[VerificationResult]:
+        """Decode the results of a streamed /verify/batch response."""
+        if ijson is None:
+            for r in _decode_json(response.content).get("results", []):
+                yield VerificationResult(r)
+            return
+        
+        response.raw.decode_content = True
+        try:
+            for r in ijson.items(response.raw, "results.item", use_float=True):
+                yield VerificationResult(r)
+        except ijson.JSONError as e:
+            raise TensalisError(f"Invalid JSON in response: {e}") from e
     
     def verify_stream(
         self,
         response_stream: Iterator[str],
         context: Union[str, List[str]],
-        check_interval: int = 50
+        check_interval: int = 50,
+        emit_batch_size: int = 8,
+        max_check_interval: int = 200,
+        interval_growth: float = 2.0
     ) -> Iterator[Dict[str, Any]]:
         """
         Verify a streaming response in real-time.
         
         Checks the accumulated response every `check_interval` tokens,
-        allowing early termination when drift is detected.
+        allowing early termination when drift is detected. Checks run in a
+        background thread, so the stream keeps flowing while a verification
+        round-trip is in flight; its outcome is reported as soon as it lands.
+        At most one check is in flight: a check that comes due meanwhile is
+        sent once it completes and covers the latest text. When the stream
+        ends, a check of an older prefix still running is superseded by one
+        of the final text.
+        
+        The interval grows by `interval_growth` after every VERIFIED check, up
+        to `max_check_interval`, and falls back to `check_interval` after any
+        other status - clean responses need fewer round-trips while problem
+        responses are still caught early.
+        
+        Every check re-sends the full context along with an
+        `X-Tensalis-Context-Hash` header holding its SHA-256 hex digest.
         
         Args:
             response_stream: Iterator yielding response chunks.
             context: Source context for verification.
-            check_interval: Tokens between verification checks.
+            check_interval: Tokens before the first check (and the minimum interval).
+            emit_batch_size: Number of chunks coalesced into each yielded item.
+            max_check_interval: Upper bound on the tokens between checks.
+            interval_growth: Factor applied to the interval after a VERIFIED check.
         
         Yields:
-            Dicts with "text" and "status" keys.
+            Dicts with "text", "status" and "result" keys. "status" is "PENDING"
+            until a check completes, then that check's status. Iteration stops
+            after a "BLOCKED" item.
         
         Example:
             >>> for chunk in client.verify_stream(llm.stream(prompt), docs):
@@ -252,30 +773,100 @@ class TensalisClient:
             ...         break
             ...     print(chunk["text"], end="")
         """
-        if isinstance(context, str):
-            context = [context]
+        context = _normalize_context(context)
+        
+        # Encode (and hash) the context once; every check re-sends the same bytes
+        context_bytes = _dumps(context)
+        context_headers = {"X-Tensalis-Context-Hash": hashlib.sha256(context_bytes).hexdigest()}
         
-        accumulated = ""
+        accumulated_parts: List[str] = []
         token_count = 0
+        current_interval = check_interval
+        max_interval = max(max_check_interval, check_interval)
+        buffered: List[str] = []
+        in_flight: Optional[Future[VerificationResult]] = None
+        checked_parts = 0
+        executor = ThreadPoolExecutor(max_workers=2)
         
-        for chunk in response_stream:
-            accumulated += chunk
-            token_count += len(chunk.split())
+        def check() -> Future[VerificationResult]:
+            return executor.submit(
+                self._verify_raw, "".join(accumulated_parts), context_bytes, context_headers
+            )
+        
+        try:
+            for chunk in response_stream:
+                accumulated_parts.append(chunk)
+                token_count += _count_tokens(chunk)
+                buffered.append(chunk)
+                
+                if in_flight is not None and in_flight.done():
+                    result = in_flight.result()
+                    in_flight = None
+                    if result.is_verified:
+                        grown = int(current_interval * interval_growth)
+                        current_interval = min(grown, max_interval)
+                    else:
+                        current_interval = check_interval
+                    
+                    event = self._stream_event(buffered, result)
+                    yield event
+                    if event["status"] == "BLOCKED":
+                        return
+                
+                if in_flight is None and token_count >= current_interval:
+                    in_flight = check()
+                    checked_parts = len(accumulated_parts)
+                    token_count = 0
+                
+                if len(buffered) >= emit_batch_size:
+                    yield self._stream_event(buffered)
             
-            if token_count >= check_interval:
-                result = self.verify(response=accumulated, context=context)
-                yield {
-                    "text": chunk,
-                    "status": result.status,
-                    "result": result.to_dict() if result.is_blocked else None
-                }
+            # Stream exhausted - only the final text still needs a verdict
+            while in_flight is not None:
+                if not in_flight.done() and checked_parts < len(accumulated_parts):
+                    in_flight.cancel()
+                    in_flight = check()
+                    checked_parts = len(accumulated_parts)
+                    token_count = 0
+                
+                result = in_flight.result()
+                in_flight = None
+                if result.is_verified:
+                    current_interval = min(int(current_interval * interval_growth), max_interval)
+                else:
+                    current_interval = check_interval
                 
-                if result.is_blocked:
+                event = self._stream_event(buffered, result)
+                yield event
+                if event["status"] == "BLOCKED":
                     return
                 
-                token_count = 0
-            else:
-                yield {"text": chunk, "status": "PENDING", "result": None}
+                if checked_parts < len(accumulated_parts) and token_count >= current_interval:
+                    in_flight = check()
+                    checked_parts = len(accumulated_parts)
+                    token_count = 0
+            
+            if buffered:
+                yield self._stream_event(buffered)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    @staticmethod
+    def _stream_event(
+        buffered: List[str],
+        result: Optional[VerificationResult] = None
+    ) -> Dict[str, Any]:
+        """Drain buffered chunks into a verify_stream item."""
+        text = "".join(buffered)
+        buffered.clear()
+        
+        if result is None:
+            return {"text": text, "status": "PENDING", "result": None}
+        return {
+            "text": text,
+            "status": result.status,
+            "result": result.to_dict(copy=True) if result.is_blocked else None
+        }
     
     def health(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,146 @@
+# tensalis/semantic_cache.py
+"""
+Semantic cache for near-duplicate verification requests.
+
+Paraphrased responses checked against the same context are often byte-different
+but semantically identical. ``SemanticCache`` embeds the verified text with a
+user-supplied embedding function and indexes it with random-projection
+locality-sensitive hashing (LSH), so a lookup only compares against the handful
+of candidates that share a bucket.
+
+Requires NumPy: ``pip install "tensalis[semantic]"``.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None  # type: ignore[assignment]
+
+from .client import VerificationResult
+from .exceptions import TensalisError
+
+# Embedding, result data and the bucket keys it is indexed under
+_Entry = Tuple[Any, Dict[str, Any], List[Tuple[str, int]]]
+
+
+class SemanticCache:
+    """
+    LSH-indexed cache of verification results for near-duplicate inputs.
+    
+    Args:
+        embed_fn: Callable mapping a string to a 1-D embedding vector.
+        n_planes: Random hyperplanes (signature bits) per hash table. Defaults to 16.
+        n_tables: Number of independent hash tables. Defaults to 8.
+        threshold: Minimum cosine similarity for a cache hit. Defaults to 0.95.
+        seed: Seed for the random hyperplanes. Defaults to 0.
+        maxsize: Entries kept before the least recently used is evicted.
+            None keeps every entry. Defaults to 1024.
+    
+    Note:
+        Embedding similarity does not guarantee factual equivalence ("30 days"
+        and "90 days" embed very closely), so keep ``threshold`` high.
+        Entries are keyed by verification mode, so one cache can be shared
+        by clients in different modes.
+    
+    Example:
+        >>> cache = SemanticCache(embed_fn=model.encode, threshold=0.97)
+        >>> client = TensalisClient(api_key="your-api-key", semantic_cache=cache)
+    """
+    
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        n_planes: int = 16,
+        n_tables: int = 8,
+        threshold: float = 0.95,
+        seed: int = 0,
+        maxsize: Optional[int] = 1024
+    ) -> None:
+        if np is None:
+            raise TensalisError(
+                "SemanticCache requires numpy: pip install \"tensalis[semantic]\""
+            )
+        
+        self.embed_fn = embed_fn
+        self.n_planes = n_planes
+        self.n_tables = n_tables
+        self.threshold = threshold
+        self.maxsize = maxsize
+        
+        self._rng = np.random.default_rng(seed)
+        self._planes: Optional[Any] = None
+        self._weights = 1 << np.arange(n_planes, dtype=np.int64)
+        # Bucket keys include the mode so entries never match across modes
+        self._tables: List[Dict[Tuple[str, int], Set[int]]] = [{} for _ in range(n_tables)]
+        # Entry ids in least-recently-used order
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+    
+    def embed(self, text: str) -> Any:
+        """Embed ``text`` and L2-normalise it so dot products are cosines."""
+        vector = np.asarray(self.embed_fn(text), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+    
+    def _bucket_keys(self, embedding: Any, mode: str) -> List[Tuple[str, int]]:
+        if self._planes is None:
+            self._planes = self._rng.standard_normal(
+                (self.n_tables, self.n_planes, embedding.shape[0])
+            ).astype(np.float32)
+        bits = (self._planes @ embedding) > 0
+        signatures: List[int] = (bits @ self._weights).tolist()
+        return [(mode, signature) for signature in signatures]
+    
+    def get(self, embedding: Any, mode: str = "balanced") -> Optional[VerificationResult]:
+        """Return the cached ``mode`` result closest to ``embedding``, if above threshold."""
+        with self._lock:
+            if not self._entries:
+                return None
+            
+            candidates: Set[int] = set()
+            for table, key in zip(self._tables, self._bucket_keys(embedding, mode)):
+                candidates.update(table.get(key, ()))
+            if not candidates:
+                return None
+            
+            ids = list(candidates)
+            scores = np.stack([self._entries[i][0] for i in ids]) @ embedding
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            self._entries.move_to_end(ids[best])
+            return VerificationResult(dict(self._entries[ids[best]][1]))
+    
+    def put(self, embedding: Any, result: VerificationResult, mode: str = "balanced") -> None:
+        """Store ``result`` for ``mode`` under ``embedding``, evicting the oldest if full."""
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            keys = self._bucket_keys(embedding, mode)
+            self._entries[entry_id] = (embedding, result.to_dict(copy=True), keys)
+            for table, key in zip(self._tables, keys):
+                table.setdefault(key, set()).add(entry_id)
+            
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                evicted, (_, _, evicted_keys) = self._entries.popitem(last=False)
+                for table, key in zip(self._tables, evicted_keys):
+                    bucket = table[key]
+                    bucket.discard(evicted)
+                    if not bucket:
+                        del table[key]
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._tables = [{} for _ in range(self.n_tables)]
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,42 +3,95 @@
 Pytest configuration and fixtures for Tensalis SDK tests.
 """
 
+import functools
+
 import pytest
 from unittest.mock import Mock
+from requests.adapters import HTTPAdapter
+
+from tensalis import TensalisClient, VerificationResult
+
+
+@functools.lru_cache(maxsize=None)
+def _vr(items):
+    return VerificationResult(dict(items))
+
+
+def _build_vr(**kw):
+    """Return a shared VerificationResult for a flat, hashable payload."""
+    return _vr(tuple(sorted(kw.items())))
+
+
+class StubAdapter(HTTPAdapter):
+    """Transport adapter that serves queued responses instead of the network."""
+    
+    def __init__(self):
+        super().__init__()
+        self.queue = []
+        self.sent = []
+    
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        item = self.queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Client shared by every test in a module; build one inline to test __init__."""
+    # Caching is off so results never leak between tests sharing the client
+    with TensalisClient(api_key="test-key", cache_size=0) as c:
+        yield c
+
+
+@pytest.fixture
+def vr():
+    """Builder for memoized VerificationResult instances."""
+    return _build_vr
+
+
+@pytest.fixture(scope="module")
+def _module_stub(client):
+    adapter = StubAdapter()
+    client._session.mount("https://", adapter)
+    return adapter
+
+
+@pytest.fixture
+def stub(_module_stub):
+    """Stub transport mounted on the shared client, emptied for each test."""
+    _module_stub.queue.clear()
+    _module_stub.sent.clear()
+    return _module_stub
 
 
 @pytest.fixture
-def mock_api_response():
-    """Factory fixture for creating mock API responses."""
-    def _create_response(status_code=200, data=None):
-        response = Mock()
-        response.status_code = status_code
-        response.content = b'{}'
-        response.json.return_value = data or {}
-        return response
-    return _create_response
+def mount_stub():
+    """Mount a fresh StubAdapter on a client built inside the test."""
+    def _mount(client):
+        adapter = StubAdapter()
+        client._session.mount("https://", adapter)
+        return adapter
+    return _mount
 
 
 @pytest.fixture
-def verified_response(mock_api_response):
-    """Mock verified response."""
-    return mock_api_response(200, {
-        "status": "VERIFIED",
-        "latency_ms": 5
-    })
+def mock_request(monkeypatch, client):
+    """Replace TensalisClient._request with a mock for the duration of a test."""
+    # Spec from the bound method: the class-level mock is called without self
+    m = Mock(spec=client._request)
+    monkeypatch.setattr(TensalisClient, "_request", m)
+    return m
 
 
 @pytest.fixture
-def blocked_response(mock_api_response):
-    """Mock blocked response."""
-    return mock_api_response(200, {
-        "status": "BLOCKED",
-        "severity": "HIGH",
-        "reason": "Contradiction detected",
-        "confidence": 0.94,
-        "layer": "cascading_nli",
-        "latency_ms": 12
-    })
+def mock_verify_raw(monkeypatch, client):
+    """Replace TensalisClient._verify_raw with a mock for the duration of a test."""
+    m = Mock(spec=client._verify_raw)
+    monkeypatch.setattr(TensalisClient, "_verify_raw", m)
+    return m
 
 
 @pytest.fixture
@@ -0,0 +1,204 @@
+"""
+Tests for the asynchronous Tensalis client.
+"""
+
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from tensalis import AsyncTensalisClient, VerificationResult
+from tensalis.exceptions import (
+    TensalisAPIError,
+    TensalisError,
+    TensalisRateLimitError,
+    TensalisTimeoutError,
+)
+
+
+def _client_with_transport(handler, **kwargs):
+    """Build a client whose HTTP traffic is served by ``handler``."""
+    client = AsyncTensalisClient(api_key="test-key", **kwargs)
+    client._client = httpx.AsyncClient(
+        base_url=client.endpoint,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestAsyncTensalisClient:
+    """Tests for AsyncTensalisClient initialization."""
+    
+    def test_client_init_without_api_key_raises_error(self):
+        """Client should raise error without API key."""
+        with pytest.raises(TensalisError, match="API key is required"):
+            AsyncTensalisClient(api_key="")
+    
+    def test_client_init_strips_trailing_slash(self):
+        """Client should strip trailing slash from endpoint."""
+        client = AsyncTensalisClient(
+            api_key="test-key",
+            endpoint="https://api.tensalis.com/v1/"
+        )
+        assert client.endpoint == "https://api.tensalis.com/v1"
+        asyncio.run(client.close())
+
+
+class TestAsyncVerify:
+    """Tests for the async verify methods."""
+    
+    def test_verify_success(self):
+        """Verify should POST to /verify and wrap the result."""
+        seen = []
+        
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"status": "VERIFIED", "latency_ms": 5})
+        
+        async def run():
+            async with _client_with_transport(handler) as client:
+                return await client.verify(response="The sky is blue.", context="Sky is blue.")
+        
+        result = asyncio.run(run())
+        assert isinstance(result, VerificationResult)
+        assert result.is_verified
+        assert seen[0].url.path == "/v1/verify"
+    
+    def test_verify_batch_success(self):
+        """Batch verify should return list of results."""
+        def handler(request):
+            return httpx.Response(200, json={
+                "results": [{"status": "VERIFIED"}, {"status": "BLOCKED"}]
+            })
+        
+        async def run():
+            async with _client_with_transport(handler) as client:
+                return await client.verify_batch([
+                    {"response": "Answer 1", "context": ["Fact 1"]},
+                    {"response": "Answer 2", "context": ["Fact 2"]},
+                ])
+        
+        results = asyncio.run(run())
+        assert [r.status for r in results] == ["VERIFIED", "BLOCKED"]
+    
+    def test_verify_stream_stops_on_block(self):
+        """Stream verification should stop after a blocked check."""
+        def handler(request):
+            return httpx.Response(200, json={"status": "BLOCKED", "severity": "HIGH"})
+        
+        async def stream():
+            for word in ["one ", "two ", "three ", "four "]:
+                yield word
+        
+        async def run():
+            async with _client_with_transport(handler) as client:
+                return [c async for c in client.verify_stream(stream(), ["ctx"], check_interval=2)]
+        
+        chunks = asyncio.run(run())
+        assert [c["status"] for c in chunks] == ["PENDING", "BLOCKED"]
+        assert chunks[-1]["result"]["severity"] == "HIGH"
+    
+    def test_verify_stream_grows_interval_after_verified(self):
+        """Check interval should double after each VERIFIED check."""
+        checked = []
+        
+        def handler(request):
+            checked.append(len(request.content))
+            return httpx.Response(200, json={"status": "VERIFIED"})
+        
+        async def stream():
+            for _ in range(14):
+                yield "word "
+        
+        async def run():
+            async with _client_with_transport(handler) as client:
+                return [c async for c in client.verify_stream(stream(), ["ctx"], check_interval=2)]
+        
+        chunks = asyncio.run(run())
+        # Checks fire after 2, 2+4 and 2+4+8 tokens
+        assert [i for i, c in enumerate(chunks, 1) if c["status"] == "VERIFIED"] == [2, 6, 14]
+
+
+class TestAsyncErrorHandling:
+    """Tests for async error handling."""
+    
+    def test_api_error_handling(self):
+        """Client should raise TensalisAPIError for API errors."""
+        def handler(request):
+            return httpx.Response(400, json={"error": "Invalid request"})
+        
+        async def run():
+            async with _client_with_transport(handler) as client:
+                await client.verify(response="test", context=["test"])
+        
+        with pytest.raises(TensalisAPIError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.status_code == 400
+    
+    def test_retries_zero_sends_one_request(self):
+        """retries=0 should still make exactly one attempt."""
+        seen = []
+        
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"status": "VERIFIED"})
+        
+        async def run():
+            async with _client_with_transport(handler, retries=0) as client:
+                return await client.verify(response="test", context=["test"])
+        
+        assert asyncio.run(run()).is_verified
+        assert len(seen) == 1
+    
+    def test_rate_limit_error_after_retries(self):
+        """A 429 left after retries should raise TensalisRateLimitError."""
+        seen = []
+        
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(
+                429, json={"error": "Too many requests"}, headers={"Retry-After": "0"}
+            )
+        
+        async def run():
+            async with _client_with_transport(handler, retries=1) as client:
+                await client.verify(response="test", context=["test"])
+        
+        with pytest.raises(TensalisRateLimitError) as exc_info:
+            asyncio.run(run())
+        assert len(seen) == 2
+        assert exc_info.value.retry_after == 0
+    
+    def test_timeout_handling(self):
+        """Client should raise TensalisTimeoutError on timeout."""
+        def handler(request):
+            raise httpx.ReadTimeout("Connection timed out", request=request)
+        
+        async def run():
+            async with _client_with_transport(handler, retries=0) as client:
+                await client.verify(response="test", context=["test"])
+        
+        with pytest.raises(TensalisTimeoutError):
+            asyncio.run(run())
+    
+    @pytest.mark.parametrize("status,exc", [
+        (502, TensalisAPIError),
+        (200, TensalisError),
+    ])
+    def test_non_json_body(self, status, exc):
+        """An HTML page from a proxy should raise an SDK error, not a decode error."""
+        def handler(request):
+            return httpx.Response(
+                status,
+                content=b"<html><body>502 Bad Gateway</body></html>",
+                headers={"Content-Type": "text/html"}
+            )
+        
+        async def run():
+            async with _client_with_transport(handler, retries=0) as client:
+                await client.verify(response="test", context=["test"])
+        
+        with pytest.raises(exc) as exc_info:
+            asyncio.run(run())
+        assert type(exc_info.value) is exc
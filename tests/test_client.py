@@ -3,256 +3,783 @@
 Tests for the Tensalis Python SDK client.
 """
 
+import copy
+import gzip
+import io
+import json
+import pickle
+import threading
+from concurrent.futures import Future
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 import requests
+from unittest.mock import call
+from urllib3.exceptions import MaxRetryError, ProtocolError, ReadTimeoutError
 
 from tensalis import TensalisClient, VerificationResult
+from tensalis.client import _count_tokens, _retry_after, zstandard
 from tensalis.exceptions import (
     TensalisError,
     TensalisAPIError,
     TensalisAuthenticationError,
+    TensalisRateLimitError,
     TensalisTimeoutError,
+    TensalisValidationError,
 )
 
 
-class TestTensalisClient:
-    """Tests for TensalisClient initialization and configuration."""
+# Tests here share the module-scoped client fixture, so keep them on one worker
+pytestmark = pytest.mark.xdist_group(name="client_tests")
+
+
+def _make_response(status_code, content):
+    """Build a real requests.Response with a JSON body."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+# Built once and re-served by the stub transport; requests only reads them
+_ERR_RESPONSE = _make_response(400, b'{"error": "Invalid request"}')
+_ERR_RESPONSES = {
+    status: _make_response(status, _ERR_RESPONSE.content) for status in (401, 429, 500)
+}
+_ERR_RESPONSES[400] = _ERR_RESPONSE
+
+_RESPONSES = {
+    "VERIFIED": _make_response(200, b'{"status": "VERIFIED", "latency_ms": 5}'),
+    "BLOCKED_HIGH": _make_response(200, json.dumps({
+        "status": "BLOCKED",
+        "severity": "HIGH",
+        "reason": "Factual contradiction",
+        "layer": "cascading_nli"
+    }).encode()),
+}
+
+_EXPECTED_HEALTH = call("GET", "/health")
+_EXPECTED_USAGE = call("GET", "/usage")
+
+
+class _InlineExecutor:
+    """Executor that runs each call on submit, so background checks finish in order."""
     
-    def test_client_init_with_api_key(self):
-        """Client should initialize with valid API key."""
-        client = TensalisClient(api_key="test-key")
-        assert client.api_key == "test-key"
-        assert client.endpoint == "https://api.tensalis.com/v1"
-        assert client.mode == "balanced"
-    
-    def test_client_init_without_api_key_raises_error(self):
-        """Client should raise error without API key."""
-        with pytest.raises(TensalisError, match="API key is required"):
-            TensalisClient(api_key="")
-    
-    def test_client_init_with_custom_endpoint(self):
-        """Client should accept custom endpoint."""
-        client = TensalisClient(
-            api_key="test-key",
-            endpoint="https://custom.tensalis.com/v1"
-        )
-        assert client.endpoint == "https://custom.tensalis.com/v1"
+    def __init__(self, max_workers=None):
+        pass
     
-    def test_client_init_strips_trailing_slash(self):
-        """Client should strip trailing slash from endpoint."""
-        client = TensalisClient(
-            api_key="test-key",
-            endpoint="https://api.tensalis.com/v1/"
-        )
-        assert client.endpoint == "https://api.tensalis.com/v1"
-    
-    def test_client_init_with_mode(self):
-        """Client should accept verification mode."""
-        client = TensalisClient(api_key="test-key", mode="strict")
-        assert client.mode == "strict"
-    
-    def test_client_context_manager(self):
-        """Client should work as context manager."""
-        with TensalisClient(api_key="test-key") as client:
-            assert client.api_key == "test-key"
-
-
-class TestVerificationResult:
-    """Tests for VerificationResult class."""
-    
-    def test_verified_result(self):
-        """Verified result should have correct properties."""
-        result = VerificationResult({
-            "status": "VERIFIED",
-            "latency_ms": 5
-        })
-        assert result.status == "VERIFIED"
-        assert result.is_verified is True
-        assert result.is_blocked is False
-        assert result.severity is None
-    
-    def test_blocked_result(self):
-        """Blocked result should have correct properties."""
-        result = VerificationResult({
-            "status": "BLOCKED",
-            "severity": "HIGH",
-            "reason": "Contradiction detected",
-            "confidence": 0.94,
-            "layer": "cascading_nli",
-            "latency_ms": 12
-        })
-        assert result.status == "BLOCKED"
-        assert result.is_blocked is True
-        assert result.is_verified is False
-        assert result.severity == "HIGH"
-        assert result.reason == "Contradiction detected"
-        assert result.confidence == 0.94
-        assert result.layer == "cascading_nli"
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
     
-    def test_result_to_dict(self):
-        """Result should convert to dictionary."""
-        data = {"status": "VERIFIED", "latency_ms": 5}
-        result = VerificationResult(data)
-        assert result.to_dict() == data
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+# Tests for TensalisClient initialization and configuration
+
+
+def test_client_init_with_api_key():
+    """Client should initialize with valid API key."""
+    client = TensalisClient(api_key="test-key")
+    assert client.api_key == "test-key"
+    assert client.endpoint == "https://api.tensalis.com/v1"
+    assert client.mode == "balanced"
+
+
+def test_client_init_without_api_key_raises_error():
+    """Client should raise error without API key."""
+    with pytest.raises(TensalisError, match="API key is required"):
+        TensalisClient(api_key="")
+
+
+def test_client_init_with_custom_endpoint():
+    """Client should accept custom endpoint."""
+    client = TensalisClient(
+        api_key="test-key",
+        endpoint="https://custom.tensalis.com/v1"
+    )
+    assert client.endpoint == "https://custom.tensalis.com/v1"
+
+
+def test_client_init_strips_trailing_slash():
+    """Client should strip trailing slash from endpoint."""
+    client = TensalisClient(
+        api_key="test-key",
+        endpoint="https://api.tensalis.com/v1/"
+    )
+    assert client.endpoint == "https://api.tensalis.com/v1"
+
+
+def test_client_init_with_mode():
+    """Client should accept verification mode."""
+    client = TensalisClient(api_key="test-key", mode="strict")
+    assert client.mode == "strict"
+
+
+def test_client_mounts_pooled_adapter():
+    """Client should mount a keep-alive adapter sized by pool_maxsize."""
+    client = TensalisClient(api_key="test-key", pool_maxsize=8)
+    adapter = client._session.get_adapter("https://api.tensalis.com/v1/verify")
+    assert adapter is client._session.get_adapter("http://localhost/verify")
+    assert adapter._pool_maxsize == 8
+    assert client._session.headers["Connection"] == "keep-alive"
+
+
+def test_client_configures_adapter_retries():
+    """Retries should be delegated to urllib3 with Retry-After support."""
+    client = TensalisClient(api_key="test-key", retries=5)
+    retry = client._session.get_adapter("https://api.tensalis.com/v1").max_retries
+    assert retry.total == 5
+    assert 429 in retry.status_forcelist
+    assert "POST" in retry.allowed_methods
+    assert retry.respect_retry_after_header
+
+
+def test_client_context_manager():
+    """Client should work as context manager."""
+    with TensalisClient(api_key="test-key") as client:
+        assert client.api_key == "test-key"
+
+
+# Tests for VerificationResult class
+
+
+def test_verified_result(vr):
+    """Verified result should have correct properties."""
+    result = vr(status="VERIFIED", latency_ms=5)
+    assert result.status == "VERIFIED"
+    assert result.is_verified is True
+    assert result.is_blocked is False
+    assert result.severity is None
+
+
+def test_blocked_result(vr):
+    """Blocked result should have correct properties."""
+    result = vr(
+        status="BLOCKED",
+        severity="HIGH",
+        reason="Contradiction detected",
+        confidence=0.94,
+        layer="cascading_nli",
+        latency_ms=12
+    )
+    assert result.status == "BLOCKED"
+    assert result.is_blocked is True
+    assert result.is_verified is False
+    assert result.severity == "HIGH"
+    assert result.reason == "Contradiction detected"
+    assert result.confidence == 0.94
+    assert result.layer == "cascading_nli"
+
+
+def test_result_to_dict(vr):
+    """Result should convert to dictionary."""
+    result = vr(status="VERIFIED", latency_ms=5)
+    view = result.to_dict()
+    assert view is result.to_dict()
+    assert view == {"status": "VERIFIED", "latency_ms": 5}
+
+
+def test_result_to_dict_is_read_only_view():
+    """to_dict() should be read-only unless a copy is requested."""
+    result = VerificationResult({"status": "VERIFIED"})
+    with pytest.raises(TypeError):
+        result.to_dict()["status"] = "BLOCKED"
     
-    def test_result_repr(self):
-        """Result should have readable repr."""
-        result = VerificationResult({"status": "BLOCKED", "severity": "HIGH"})
-        assert "BLOCKED" in repr(result)
-        assert "HIGH" in repr(result)
+    copied = result.to_dict(copy=True)
+    copied["status"] = "BLOCKED"
+    assert result.status == "VERIFIED"
+
+
+@pytest.mark.parametrize("clone", [
+    lambda result: pickle.loads(pickle.dumps(result)),
+    copy.deepcopy,
+], ids=["pickle", "deepcopy"])
+def test_result_survives_pickle_and_deepcopy(clone):
+    """Results should pickle and deep-copy despite holding a read-only view."""
+    result = VerificationResult({"status": "BLOCKED", "severity": "HIGH"})
+    cloned = clone(result)
+    assert cloned.to_dict() == result.to_dict()
+    assert cloned.is_blocked
+    with pytest.raises(TypeError):
+        cloned.to_dict()["status"] = "VERIFIED"
+
+
+def test_result_has_no_instance_dict():
+    """Result should be slotted to keep per-instance overhead low."""
+    result = VerificationResult({"status": "VERIFIED"})
+    assert not hasattr(result, "__dict__")
+
+
+def test_result_repr(vr):
+    """Result should have readable repr."""
+    result = vr(status="BLOCKED", severity="HIGH")
+    assert "BLOCKED" in repr(result)
+    assert "HIGH" in repr(result)
 
 
 class TestVerify:
     """Tests for the verify method."""
     
-    @patch.object(TensalisClient, '_request')
-    def test_verify_success(self, mock_request):
-        """Verify should return VerificationResult on success."""
-        mock_request.return_value = {
-            "status": "VERIFIED",
-            "latency_ms": 5
+    @pytest.mark.parametrize("mode,kwargs,expected_mock,assert_fn", [
+        pytest.param(
+            "single",
+            {
+                "response": "The sky is blue.",
+                "context": ["The sky appears blue during clear days."]
+            },
+            {"status": "VERIFIED", "latency_ms": 5},
+            lambda result, mock: (
+                isinstance(result, VerificationResult)
+                and result.is_verified
+                and mock.call_count == 1
+            ),
+            id="success",
+        ),
+        pytest.param(
+            "single",
+            {
+                "response": "Returns allowed within 90 days.",
+                "context": ["Returns accepted within 30 days."]
+            },
+            {
+                "status": "BLOCKED",
+                "severity": "HIGH",
+                "reason": "Factual contradiction",
+                "layer": "cascading_nli"
+            },
+            lambda result, mock: result.is_blocked and result.severity == "HIGH",
+            id="blocked",
+        ),
+        pytest.param(
+            "single",
+            {"response": "Test response.", "context": "Single context string."},
+            {"status": "VERIFIED"},
+            lambda result, mock: isinstance(mock.call_args.args[2]["reference_facts"], list),
+            id="string-context",
+        ),
+        pytest.param(
+            "single",
+            {
+                "response": "Test response.",
+                "context": ["Test context."],
+                "metadata": {"user_id": "123", "session": "abc"}
+            },
+            {"status": "VERIFIED"},
+            lambda result, mock: (
+                mock.call_args.args[2]["metadata"] == {"user_id": "123", "session": "abc"}
+            ),
+            id="metadata",
+        ),
+        pytest.param(
+            "batch",
+            [
+                {"response": "Answer 1", "context": ["Fact 1"]},
+                {"response": "Answer 2", "context": ["Fact 2"]},
+            ],
+            {"results": [{"status": "VERIFIED"}, {"status": "BLOCKED", "severity": "HIGH"}]},
+            lambda results, mock: (
+                len(results) == 2 and results[0].is_verified and results[1].is_blocked
+            ),
+            id="batch",
+        ),
+    ])
+    def test_verify(self, client, mock_request, mode, kwargs, expected_mock, assert_fn):
+        """Verify should send the payload and wrap the API response."""
+        mock_request.return_value = expected_mock
+        result = client.verify_batch(kwargs) if mode == "batch" else client.verify(**kwargs)
+        assert assert_fn(result, mock_request)
+
+
+class TestValidation:
+    """Tests for client-side input validation."""
+    
+    @pytest.mark.parametrize("response,context,field", [
+        ("", ["Fact."], "response"),
+        ("Answer.", [], "context"),
+        ("Answer.", ["Fact.", None], "context"),
+    ])
+    def test_invalid_input_rejected_before_request(
+        self, mock_request, response, context, field, client
+    ):
+        """Invalid inputs should raise TensalisValidationError without an API call."""
+        with pytest.raises(TensalisValidationError) as exc_info:
+            client.verify(response=response, context=context)
+        
+        assert exc_info.value.field == field
+        mock_request.assert_not_called()
+    
+    def test_response_length_limit_is_opt_in(self, mock_request):
+        """Long responses should only be rejected when max_response_length is set."""
+        mock_request.return_value = {"status": "VERIFIED"}
+        
+        TensalisClient(api_key="test-key").verify(response="x" * 200_000, context=["Fact."])
+        
+        client = TensalisClient(api_key="test-key", max_response_length=10)
+        with pytest.raises(TensalisValidationError) as exc_info:
+            client.verify(response="x" * 11, context=["Fact."])
+        
+        assert exc_info.value.details == {"length": 11, "max_length": 10}
+        assert mock_request.call_count == 1
+
+
+class TestWireFormat:
+    """Tests for request/response serialization."""
+    
+    def test_verify_sends_encoded_json_body(self, client, stub):
+        """Payload should be sent pre-encoded and the response body decoded."""
+        stub.queue.append(_RESPONSES["BLOCKED_HIGH"])
+        
+        result = client.verify(response="Answer.", context=["Fact."])
+        
+        sent = stub.sent[0]
+        assert isinstance(sent.body, bytes)
+        assert json.loads(sent.body) == {"response": "Answer.", "reference_facts": ["Fact."]}
+        assert sent.url == "https://api.tensalis.com/v1/verify"
+        assert result.severity == "HIGH"
+    
+    def test_bodies_are_uncompressed_by_default(self, client, stub):
+        """Compression should be opt-in, however large the body."""
+        stub.queue.append(_RESPONSES["VERIFIED"])
+        
+        client.verify(response="Answer.", context=["Returns are accepted within 30 days. " * 200])
+        
+        assert "Content-Encoding" not in stub.sent[0].headers
+        assert json.loads(stub.sent[0].body)["response"] == "Answer."
+    
+    def test_large_bodies_are_compressed(self, mount_stub):
+        """Bodies over the threshold should be sent compressed."""
+        client = TensalisClient(api_key="test-key", compression_threshold=64)
+        stub = mount_stub(client)
+        stub.queue.extend([_RESPONSES["VERIFIED"]] * 2)
+        
+        client.verify(response="Answer.", context=["Returns are accepted within 30 days. " * 20])
+        
+        sent = stub.sent[0]
+        if sent.headers["Content-Encoding"] == "gzip":
+            body = gzip.decompress(sent.body)
+        else:
+            body = zstandard.ZstdDecompressor().decompress(sent.body)
+        assert json.loads(body)["response"] == "Answer."
+        
+        client.verify(response="Short.", context=["Fact."])
+        assert "Content-Encoding" not in stub.sent[1].headers
+    
+    def test_verify_raw_splices_encoded_context(self, mock_request, client):
+        """Pre-encoded context should be spliced into a valid JSON body."""
+        mock_request.return_value = {"status": "VERIFIED"}
+        
+        client._verify_raw('Say "hi"', b'["Fact."]', {"X-Tensalis-Context-Hash": "abc"})
+        
+        kwargs = mock_request.call_args.kwargs
+        assert json.loads(kwargs["body"]) == {"response": 'Say "hi"', "reference_facts": ["Fact."]}
+        assert kwargs["headers"] == {"X-Tensalis-Context-Hash": "abc"}
+
+
+class TestVerifyCache:
+    """Tests for the verify() result cache."""
+    
+    def test_repeated_verify_hits_cache(self, mock_request):
+        """Identical verify calls should only reach the API once."""
+        mock_request.return_value = {"status": "VERIFIED"}
+        
+        client = TensalisClient(api_key="test-key")
+        first = client.verify(response="Answer.", context=["Fact."])
+        second = client.verify(response="Answer.", context="Fact.")
+        
+        assert first.is_verified and second.is_verified
+        mock_request.assert_called_once()
+        assert client.cache_stats == {
+            "hits": 1, "misses": 1, "local_hits": 0, "size": 1, "maxsize": 1024
         }
+    
+    def test_cache_evicts_least_recently_used(self, mock_request):
+        """Cache should evict the oldest entry once full."""
+        mock_request.return_value = {"status": "VERIFIED"}
+        
+        client = TensalisClient(api_key="test-key", cache_size=1)
+        client.verify(response="Answer 1.", context=["Fact."])
+        client.verify(response="Answer 2.", context=["Fact."])
+        client.verify(response="Answer 1.", context=["Fact."])
+        
+        assert mock_request.call_count == 3
+        assert client.cache_stats["size"] == 1
+    
+    def test_metadata_and_disabled_cache_bypass(self, mock_request):
+        """Calls with metadata, or with caching disabled, always hit the API."""
+        mock_request.return_value = {"status": "VERIFIED"}
         
+        client = TensalisClient(api_key="test-key")
+        for _ in range(2):
+            client.verify(response="Answer.", context=["Fact."], metadata={"id": 1})
+        
+        uncached = TensalisClient(api_key="test-key", cache_size=0)
+        for _ in range(2):
+            uncached.verify(response="Answer.", context=["Fact."])
+        
+        assert mock_request.call_count == 4
+        client.cache_clear()
+        assert client.cache_stats["hits"] == 0
+
+
+class TestLocalFastpath:
+    """Tests for the verbatim-extract fast path."""
+    
+    def test_verbatim_extract_skips_api(self, mock_request):
+        """A response quoted from the context should verify locally."""
         client = TensalisClient(api_key="test-key")
         result = client.verify(
-            response="The sky is blue.",
-            context=["The sky appears blue during clear days."]
+            response="Returns are  ACCEPTED within 30 days",
+            context=["Policy.", "Returns are accepted within 30 days of purchase."]
         )
         
-        assert isinstance(result, VerificationResult)
         assert result.is_verified
-        mock_request.assert_called_once()
+        assert result.layer == "client_substring"
+        assert client.cache_stats["local_hits"] == 1
+        mock_request.assert_not_called()
     
-    @patch.object(TensalisClient, '_request')
-    def test_verify_blocked(self, mock_request):
-        """Verify should return blocked result for hallucinations."""
-        mock_request.return_value = {
-            "status": "BLOCKED",
-            "severity": "HIGH",
-            "reason": "Factual contradiction",
-            "layer": "cascading_nli"
-        }
+    @pytest.mark.parametrize("response", [
+        "Returns are accepted within 3",
+        "Returns are accepted with",
+        "eturns are accepted within 30 days",
+        "Orders over 30 qualify for free shipping",
+    ])
+    def test_truncated_tokens_reach_api(self, mock_request, response):
+        """A match that cuts a number or word short is not a verbatim extract."""
+        mock_request.return_value = {"status": "BLOCKED"}
         
+        client = TensalisClient(api_key="test-key")
+        result = client.verify(response=response, context=[
+            "Returns are accepted within 30 days of purchase.",
+            "Orders over 30,000 qualify for free shipping."
+        ])
+        
+        assert result.is_blocked
+        assert client.cache_stats["local_hits"] == 0
+    
+    def test_extract_ending_at_punctuation_skips_api(self, mock_request):
+        """A whole-token match followed by punctuation should still verify locally."""
         client = TensalisClient(api_key="test-key")
         result = client.verify(
-            response="Returns allowed within 90 days.",
-            context=["Returns accepted within 30 days."]
+            response="accepted within 30 days of purchase",
+            context=["Returns are accepted within 30 days of purchase."]
         )
         
-        assert result.is_blocked
-        assert result.severity == "HIGH"
+        assert result.layer == "client_substring"
+        mock_request.assert_not_called()
     
-    @patch.object(TensalisClient, '_request')
-    def test_verify_with_string_context(self, mock_request):
-        """Verify should accept string context."""
+    def test_short_or_novel_response_reaches_api(self, mock_request):
+        """Short or non-verbatim responses should still be sent to the API."""
         mock_request.return_value = {"status": "VERIFIED"}
         
         client = TensalisClient(api_key="test-key")
-        client.verify(
-            response="Test response.",
-            context="Single context string."
-        )
+        client.verify(response="30 days", context=["Returns within 30 days."])
+        client.verify(response="Returns are accepted within 90 days", context=[
+            "Returns are accepted within 30 days of purchase."
+        ])
         
-        call_args = mock_request.call_args
-        payload = call_args[0][2]
-        assert isinstance(payload["reference_facts"], list)
+        assert mock_request.call_count == 2
     
-    @patch.object(TensalisClient, '_request')
-    def test_verify_with_metadata(self, mock_request):
-        """Verify should pass metadata to API."""
-        mock_request.return_value = {"status": "VERIFIED"}
+    def test_response_spanning_documents_reaches_api(self, mock_request):
+        """Text straddling two separate documents is not a verbatim extract."""
+        mock_request.return_value = {"status": "BLOCKED"}
         
         client = TensalisClient(api_key="test-key")
-        client.verify(
-            response="Test response.",
-            context=["Test context."],
-            metadata={"user_id": "123", "session": "abc"}
+        result = client.verify(
+            response="within 30 days refunds are never issued",
+            context=["Returns are accepted within 30 days", "Refunds are never issued late."]
         )
         
-        call_args = mock_request.call_args
-        payload = call_args[0][2]
-        assert payload["metadata"] == {"user_id": "123", "session": "abc"}
+        assert result.is_blocked
+        assert client.cache_stats["local_hits"] == 0
+    
+    def test_fastpath_defaults_off_in_strict_mode(self):
+        """Strict mode should disable the fast path unless explicitly enabled."""
+        assert TensalisClient(api_key="test-key", mode="strict").enable_local_fastpath is False
+        with pytest.warns(UserWarning):
+            TensalisClient(api_key="test-key", mode="strict", enable_local_fastpath=True)
 
 
 class TestVerifyBatch:
     """Tests for batch verification."""
     
-    @patch.object(TensalisClient, '_request')
-    def test_verify_batch_success(self, mock_request):
-        """Batch verify should return list of results."""
-        mock_request.return_value = {
-            "results": [
-                {"status": "VERIFIED"},
-                {"status": "BLOCKED", "severity": "HIGH"}
-            ]
-        }
+    def test_verify_batch_splits_large_batches(self, mock_request):
+        """Large batches should be chunked and merged back in input order."""
+        def echo(method, path, payload):
+            return {"results": [{"reason": item["response"]} for item in payload["items"]]}
+        mock_request.side_effect = echo
         
-        client = TensalisClient(api_key="test-key")
-        results = client.verify_batch([
+        client = TensalisClient(api_key="test-key", max_batch_size=2, max_concurrency=3)
+        items = [{"response": str(n), "context": ["Fact"]} for n in range(5)]
+        results = client.verify_batch(items)
+        
+        assert mock_request.call_count == 3
+        assert [r.reason for r in results] == ["0", "1", "2", "3", "4"]
+
+
+class TestIterVerifyBatch:
+    """Tests for incremental batch verification."""
+    
+    @pytest.mark.parametrize("incremental", [True, False])
+    def test_iter_verify_batch_yields_in_order(self, client, stub, monkeypatch, incremental):
+        """Results should be yielded in order with or without ijson."""
+        if not incremental:
+            monkeypatch.setattr("tensalis.client.ijson", None)
+        body = b'{"results": [{"status": "VERIFIED"}, {"status": "BLOCKED", "confidence": 0.9}]}'
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(body)
+        stub.queue.append(response)
+        
+        results = list(client.iter_verify_batch([
             {"response": "Answer 1", "context": ["Fact 1"]},
             {"response": "Answer 2", "context": ["Fact 2"]},
-        ])
+        ]))
+        
+        assert [r.status for r in results] == ["VERIFIED", "BLOCKED"]
+        assert results[1].confidence == 0.9
+        assert stub.sent[0].path_url == "/v1/verify/batch"
+    
+    @pytest.mark.parametrize("incremental", [True, False])
+    @pytest.mark.parametrize("error,exc", [
+        (ProtocolError("Connection broken: IncompleteRead"), TensalisError),
+        (ReadTimeoutError(None, "/verify/batch", "Read timed out"), TensalisTimeoutError),
+    ], ids=["protocol-error", "read-timeout"])
+    def test_body_read_errors_are_translated(
+        self, client, stub, monkeypatch, incremental, error, exc
+    ):
+        """A body that fails partway through should raise an SDK exception."""
+        if not incremental:
+            monkeypatch.setattr("tensalis.client.ijson", None)
         
-        assert len(results) == 2
-        assert results[0].is_verified
-        assert results[1].is_blocked
+        class FailingRaw:
+            """Serves the first bytes of a body, then fails like a dropped connection."""
+            
+            def __init__(self, head):
+                self.head = head
+            
+            def read(self, size=-1):
+                if size == 0:
+                    return b""
+                if not self.head:
+                    raise error
+                head, self.head = self.head, b""
+                return head
+            
+            def close(self):
+                pass
+        
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = FailingRaw(b'{"results": [{"status": "VERIFIED"}, {"sta')
+        stub.queue.append(response)
+        
+        with pytest.raises(exc) as exc_info:
+            list(client.iter_verify_batch([{"response": "Answer", "context": ["Fact"]}]))
+        
+        assert type(exc_info.value) is exc
+
+
+class TestVerifyStream:
+    """Tests for streaming verification."""
+    
+    def test_count_tokens(self):
+        """Token counter should be exact for short chunks and close for long ones."""
+        assert _count_tokens(" word") == 1
+        assert _count_tokens("two words ") == 2
+        assert _count_tokens("token " * 100) in (100, 101)
+        assert _count_tokens("line\n" * 40) == 40
+        assert _count_tokens("\tindented\n" * 20) == 20
+    
+    def test_stream_coalesces_chunks(self, mock_verify_raw, client):
+        """Chunks should be emitted in batches of emit_batch_size."""
+        chunks = [f"word{i} " for i in range(10)]
+        
+        events = list(client.verify_stream(
+            iter(chunks), ["ctx"], check_interval=100, emit_batch_size=4
+        ))
+        
+        assert [e["status"] for e in events] == ["PENDING"] * 3
+        assert "".join(e["text"] for e in events) == "".join(chunks)
+        mock_verify_raw.assert_not_called()
+    
+    def test_stream_stops_on_block(self, mock_verify_raw, client):
+        """Stream should end with a BLOCKED item once a check fails."""
+        mock_verify_raw.return_value = VerificationResult({"status": "BLOCKED", "severity": "HIGH"})
+        chunks = [f"word{i} " for i in range(10)]
+        
+        events = list(client.verify_stream(
+            iter(chunks), "ctx", check_interval=3, emit_batch_size=1
+        ))
+        
+        assert events[-1]["status"] == "BLOCKED"
+        assert events[-1]["result"]["severity"] == "HIGH"
+        assert json.loads(json.dumps(events[-1]))["result"]["severity"] == "HIGH"
+        assert all(e["status"] == "PENDING" for e in events[:-1])
+        assert "".join(e["text"] for e in events) == "".join(chunks[:len(events)])
+    
+    def test_stream_reports_in_flight_check_at_end(self, mock_verify_raw, client):
+        """A check still running when the stream ends should still be reported."""
+        mock_verify_raw.return_value = VerificationResult({"status": "VERIFIED"})
+        
+        events = list(client.verify_stream(iter(["a b ", "c d "]), ["ctx"], check_interval=4))
+        
+        assert events[-1]["status"] == "VERIFIED"
+        assert "".join(e["text"] for e in events) == "a b c d "
+        mock_verify_raw.assert_called_once()
+        assert mock_verify_raw.call_args.args[:2] == ("a b c d ", b'["ctx"]')
+    
+    def test_stream_keeps_one_check_in_flight(self, client, mock_verify_raw):
+        """Checks due while one is in flight should collapse into one of the latest text."""
+        release = threading.Event()
+        
+        def slow_check(text, context_bytes, headers):
+            release.wait(5)
+            return VerificationResult({"status": "VERIFIED"})
+        
+        mock_verify_raw.side_effect = slow_check
+        
+        def stream():
+            yield from ["word "] * 40
+            release.set()
+        
+        events = list(client.verify_stream(stream(), ["ctx"], check_interval=4))
+        
+        texts = [c.args[0] for c in mock_verify_raw.call_args_list]
+        assert texts == ["word " * 4, "word " * 40]
+        assert events[-1]["status"] == "VERIFIED"
+        assert "".join(e["text"] for e in events) == "word " * 40
+    
+    def test_stream_interval_grows_after_verified(self, client, mock_verify_raw, monkeypatch):
+        """Checks should become less frequent while results stay VERIFIED."""
+        monkeypatch.setattr("tensalis.client.ThreadPoolExecutor", _InlineExecutor)
+        mock_verify_raw.return_value = VerificationResult({"status": "VERIFIED"})
+        
+        list(client.verify_stream(
+            iter(["word "] * 14), ["ctx"], check_interval=2, emit_batch_size=1
+        ))
+        
+        # Checks fire after 2, 2+4 and 2+4+8 tokens
+        texts = [c.args[0] for c in mock_verify_raw.call_args_list]
+        assert texts == ["word " * 2, "word " * 6, "word " * 14]
 
 
 class TestErrorHandling:
     """Tests for error handling."""
     
-    @patch('tensalis.client.requests.Session.request')
-    def test_api_error_handling(self, mock_request):
+    @pytest.mark.parametrize("status,exc", [
+        (400, TensalisAPIError),
+        (401, TensalisAPIError),
+        (429, TensalisRateLimitError),
+        (500, TensalisAPIError),
+    ])
+    def test_api_error_handling(self, client, stub, status, exc):
         """Client should raise TensalisAPIError for API errors."""
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.content = b'{"error": "Invalid request"}'
-        mock_response.json.return_value = {"error": "Invalid request"}
-        mock_request.return_value = mock_response
+        stub.queue.append(_ERR_RESPONSES[status])
         
-        client = TensalisClient(api_key="test-key")
+        with pytest.raises(exc) as exc_info:
+            client.verify(response="test", context=["test"])
+        
+        assert exc_info.value.status_code == status
+        assert exc_info.value.message == "Invalid request"
+    
+    @pytest.mark.parametrize("error,exc", [
+        pytest.param(
+            requests.Timeout("Connection timed out"), TensalisTimeoutError, id="timeout"
+        ),
+        pytest.param(
+            requests.ConnectionError(MaxRetryError(
+                None, "/verify", ReadTimeoutError(None, "/verify", "Read timed out")
+            )),
+            TensalisTimeoutError,
+            id="exhausted-timeout-retries",
+        ),
+        pytest.param(
+            requests.ConnectionError("Connection refused"), TensalisError, id="connection-error"
+        ),
+    ])
+    def test_transport_error_handling(self, mount_stub, error, exc):
+        """Transport failures should surface as Tensalis exceptions."""
+        client = TensalisClient(api_key="test-key", retries=0)
+        mount_stub(client).queue.append(error)
+        
+        with pytest.raises(exc) as exc_info:
+            client.verify(response="test", context=["test"])
         
-        with pytest.raises(TensalisAPIError) as exc_info:
+        assert type(exc_info.value) is exc
+    
+    @pytest.mark.parametrize("status,exc", [
+        (502, TensalisAPIError),
+        (200, TensalisError),
+    ])
+    def test_non_json_body(self, client, stub, status, exc):
+        """An HTML page from a proxy should raise an SDK error, not a decode error."""
+        response = _make_response(status, b"<html><body>502 Bad Gateway</body></html>")
+        response.headers["Content-Type"] = "text/html"
+        stub.queue.append(response)
+        
+        with pytest.raises(exc) as exc_info:
             client.verify(response="test", context=["test"])
         
-        assert exc_info.value.status_code == 400
+        assert type(exc_info.value) is exc
+        if status >= 400:
+            assert exc_info.value.status_code == status
+            assert exc_info.value.response == {}
     
-    @patch('tensalis.client.requests.Session.request')
-    def test_timeout_handling(self, mock_request):
-        """Client should raise TensalisTimeoutError on timeout."""
-        mock_request.side_effect = requests.Timeout("Connection timed out")
+    def test_rate_limit_error_after_retries(self, client, stub):
+        """A 429 left after retries should raise TensalisRateLimitError."""
+        response = _make_response(429, b'{"error": "Too many requests"}')
+        response.headers["Retry-After"] = "7"
+        stub.queue.append(response)
         
-        client = TensalisClient(api_key="test-key", retries=1)
+        with pytest.raises(TensalisRateLimitError) as exc_info:
+            client.verify(response="test", context=["test"])
+        
+        assert exc_info.value.retry_after == 7
+    
+    @pytest.mark.parametrize("header,expected", [
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0),
+        ("soon", 60),
+    ], ids=["past-http-date", "garbage"])
+    def test_rate_limit_error_with_non_numeric_retry_after(self, client, stub, header, expected):
+        """A Retry-After that is not delta-seconds must not mask the rate-limit error."""
+        response = _make_response(429, b'{"error": "Too many requests"}')
+        response.headers["Retry-After"] = header
+        stub.queue.append(response)
         
-        with pytest.raises(TensalisTimeoutError):
+        with pytest.raises(TensalisRateLimitError) as exc_info:
             client.verify(response="test", context=["test"])
+        
+        assert exc_info.value.retry_after == expected
+    
+    def test_retry_after_http_date_in_future(self, monkeypatch):
+        """An HTTP-date Retry-After should become seconds from now."""
+        monkeypatch.setattr("tensalis.client.time.time", lambda: 1445412470.0)
+        
+        assert _retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 10
 
 
 class TestHealthAndUsage:
     """Tests for health and usage endpoints."""
     
-    @patch.object(TensalisClient, '_request')
-    def test_health_check(self, mock_request):
+    def test_health_check(self, client, mock_request):
         """Health check should return status."""
         mock_request.return_value = {"status": "healthy", "latency_ms": 2}
         
-        client = TensalisClient(api_key="test-key")
         result = client.health()
         
         assert result["status"] == "healthy"
-        mock_request.assert_called_with("GET", "/health")
+        assert mock_request.call_args == _EXPECTED_HEALTH
     
-    @patch.object(TensalisClient, '_request')
-    def test_usage_check(self, mock_request):
+    def test_usage_check(self, client, mock_request):
         """Usage check should return metrics."""
         mock_request.return_value = {
             "requests_today": 1000,
             "limit": 10000
         }
         
-        client = TensalisClient(api_key="test-key")
         result = client.usage()
         
         assert result["requests_today"] == 1000
-        mock_request.assert_called_with("GET", "/usage")
+        assert mock_request.call_args == _EXPECTED_USAGE
@@ -0,0 +1,105 @@
+"""
+Tests for the LSH-backed semantic cache.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tensalis import SemanticCache, TensalisClient, VerificationResult
+
+
+def letter_counts(text):
+    """Tiny deterministic embedder: bag of lowercase letters."""
+    vector = [0.0] * 26
+    for ch in text.lower():
+        if "a" <= ch <= "z":
+            vector[ord(ch) - ord("a")] += 1.0
+    return vector
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache lookup behaviour."""
+    
+    def test_get_on_empty_cache_returns_none(self):
+        """Empty cache should always miss."""
+        cache = SemanticCache(embed_fn=letter_counts)
+        assert cache.get(cache.embed("anything")) is None
+    
+    def test_near_duplicate_hits(self):
+        """Reordered text with identical letters should hit."""
+        cache = SemanticCache(embed_fn=letter_counts)
+        verified = VerificationResult({"status": "VERIFIED"})
+        cache.put(cache.embed("returns within thirty days"), verified)
+        
+        result = cache.get(cache.embed("within thirty days returns"))
+        assert result is not None
+        assert result.is_verified
+        assert len(cache) == 1
+    
+    def test_dissimilar_text_misses(self):
+        """Unrelated text should fall below the threshold."""
+        cache = SemanticCache(embed_fn=letter_counts, threshold=0.99)
+        verified = VerificationResult({"status": "VERIFIED"})
+        cache.put(cache.embed("returns within thirty days"), verified)
+        
+        assert cache.get(cache.embed("xylophone quiz jukebox")) is None
+        cache.clear()
+        assert len(cache) == 0
+    
+    def test_evicts_least_recently_used(self):
+        """Cache should stay within maxsize, evicting the least recently used entry."""
+        cache = SemanticCache(embed_fn=letter_counts, maxsize=2)
+        verified = VerificationResult({"status": "VERIFIED"})
+        cache.put(cache.embed("returns within thirty days"), verified)
+        cache.put(cache.embed("refunds take five business days"), verified)
+        assert cache.get(cache.embed("within thirty days returns")) is not None
+        
+        cache.put(cache.embed("items need original packaging"), verified)
+        
+        assert len(cache) == 2
+        assert cache.get(cache.embed("returns within thirty days")) is not None
+        assert cache.get(cache.embed("refunds take five business days")) is None
+        assert sum(len(bucket) for table in cache._tables for bucket in table.values()) == 16
+    
+    def test_entries_are_keyed_by_mode(self):
+        """A result stored for one mode should not be served for another."""
+        cache = SemanticCache(embed_fn=letter_counts)
+        cache.put(cache.embed("returns within thirty days"), VerificationResult({
+            "status": "VERIFIED"
+        }), "permissive")
+        
+        assert cache.get(cache.embed("returns within thirty days"), "strict") is None
+        assert cache.get(cache.embed("returns within thirty days"), "permissive") is not None
+
+
+class TestClientSemanticCache:
+    """Tests for semantic cache integration in TensalisClient.verify."""
+    
+    def test_paraphrase_skips_api(self, mock_request):
+        """A near-duplicate response should be served from the semantic cache."""
+        mock_request.return_value = {"status": "BLOCKED", "severity": "HIGH"}
+        
+        client = TensalisClient(
+            api_key="test-key",
+            cache_size=0,
+            semantic_cache=SemanticCache(embed_fn=letter_counts)
+        )
+        client.verify(response="Returns within ninety days.", context=["Thirty days."])
+        result = client.verify(response="Within ninety days returns.", context=["Thirty days."])
+        
+        assert result.is_blocked
+        mock_request.assert_called_once()
+    
+    def test_cache_shared_across_modes(self, mock_request):
+        """Clients in different modes sharing a cache should not serve each other."""
+        mock_request.return_value = {"status": "VERIFIED"}
+        cache = SemanticCache(embed_fn=letter_counts)
+        
+        for mode in ("permissive", "strict"):
+            client = TensalisClient(
+                api_key="test-key", mode=mode, cache_size=0, semantic_cache=cache
+            )
+            client.verify(response="Returns within ninety days.", context=["Thirty days."])
+        
+        assert mock_request.call_count == 2